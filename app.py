@@ -1,39 +1,130 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from quart import Quart, render_template, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+import orjson
 import os
-import json
-from werkzeug.utils import secure_filename
-from paper_summarizer import PaperSummarizer
-import tempfile
+import io
+from summarizer_factory import get_summarizer
 import traceback
+import logging
+import queue
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-app = Flask(__name__)
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson straight to bytes."""
+
+    def _options(self):
+        return orjson.OPT_SORT_KEYS if self.sort_keys else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options()),
+            mimetype=self.mimetype
+        )
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue records unformatted so tracebacks are rendered off the request path."""
+
+    def prepare(self, record):
+        return record
+
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+# Log through a queue so request handlers never block on log formatting or I/O
+_log_queue = queue.Queue(-1)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+logging.basicConfig(level=logging.INFO, handlers=[DeferredQueueHandler(_log_queue)])
+log_listener = QueueListener(_log_queue, _stream_handler)
+log_listener.start()
+
+logger = logging.getLogger(__name__)
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-app.config['UPLOAD_FOLDER'] = 'uploads'
 
-# Create upload directory if it doesn't exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+def _init_worker():
+    """Set up logging and build the summarizer once per worker process.
+    
+    Building it opens the HTTP session and the on-disk result cache up front;
+    spaCy and the PDF/HTML parsers are only imported when a request needs them.
+    """
+    # A forked worker inherits the queue handler, but no listener drains the
+    # worker's copy of the queue; log straight to stderr instead
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, force=True)
+    get_summarizer(cache=True)
+
+def _summarize(input_source, input_type, metadata):
+    """Run the summarizer inside a worker process."""
+    return get_summarizer(cache=True).summarize_paper(input_source, input_type, metadata)
+
+def _create_executor():
+    """Start a pool of summarizer worker processes."""
+    return ProcessPoolExecutor(
+        max_workers=int(os.environ.get('SUMMARIZER_PROCESSES', os.cpu_count() or 1)),
+        initializer=_init_worker
+    )
+
+# PDF parsing and text analysis are CPU-bound and hold the GIL, so they run
+# in a pool of worker processes rather than on the request's event loop
+EXECUTOR = _create_executor()
 
-# Initialize the summarizer
-summarizer = PaperSummarizer()
+async def run_summarizer(input_source, input_type, metadata):
+    """Summarize a paper in the worker pool without blocking the event loop."""
+    global EXECUTOR
+    loop = asyncio.get_running_loop()
+    executor = EXECUTOR
+    try:
+        return await loop.run_in_executor(executor, _summarize, input_source, input_type, metadata)
+    except BrokenProcessPool:
+        # A worker died (e.g. crashed or was OOM-killed on a malformed PDF),
+        # which breaks the whole pool; replace it so only this request fails
+        if EXECUTOR is executor:
+            EXECUTOR = _create_executor()
+            executor.shutdown(wait=False)
+        raise
+
+def error_response(message, error):
+    """Log a failed request and return a short JSON error with a request ID."""
+    request_id = uuid.uuid4().hex
+    logger.exception('%s (request %s)', message, request_id)
+    
+    body = {'error': f'{message}: {str(error)}', 'request_id': request_id}
+    if app.debug:
+        body['traceback'] = traceback.format_exc()
+    return jsonify(body), 500
 
-ALLOWED_EXTENSIONS = {'pdf', 'txt'}
+ALLOWED_EXTENSIONS = frozenset({'.pdf', '.txt'})
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
 
 @app.route('/')
-def index():
+async def index():
     """Main page with upload interface."""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 @app.route('/api/summarize', methods=['POST'])
-def summarize_file():
+async def summarize_file():
     """API endpoint to summarize uploaded file."""
     try:
-        if 'file' not in request.files:
+        files = await request.files
+        form = await request.form
+        if 'file' not in files:
             return jsonify({'error': 'No file uploaded'}), 400
         
-        file = request.files['file']
+        file = files['file']
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
@@ -42,60 +133,43 @@ def summarize_file():
         
         # Get metadata from form
         metadata = {
-            'title': request.form.get('title', ''),
-            'authors': request.form.get('authors', ''),
-            'venue_year': request.form.get('venue_year', ''),
-            'doi_or_arxiv': request.form.get('doi_or_arxiv', '')
+            'title': form.get('title', ''),
+            'authors': form.get('authors', ''),
+            'venue_year': form.get('venue_year', ''),
+            'doi_or_arxiv': form.get('doi_or_arxiv', '')
         }
         
-        # Save uploaded file temporarily
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        # Hand the upload straight to the summarizer instead of
+        # round-tripping it through the upload folder
+        if file.filename.lower().endswith('.pdf'):
+            pdf_stream = io.BytesIO(file.stream.read())
+            result = await run_summarizer(pdf_stream, 'pdf_stream', metadata)
+        else:  # txt file
+            text = file.stream.read().decode('utf-8')
+            result = await run_summarizer(text, 'text', metadata)
         
-        try:
-            # Determine file type and summarize
-            if filename.lower().endswith('.pdf'):
-                result = summarizer.summarize_paper(filepath, 'pdf', metadata)
-            else:  # txt file
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                result = summarizer.summarize_paper(text, 'text', metadata)
-            
-            # Clean up uploaded file
-            os.remove(filepath)
-            
-            return jsonify({
-                'success': True,
-                'markdown': result['markdown'],
-                'json': result['json'],
-                'metadata': result['metadata']
-            })
-            
-        except Exception as e:
-            # Clean up uploaded file on error
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            raise e
-            
-    except Exception as e:
         return jsonify({
-            'error': f'Error processing file: {str(e)}',
-            'traceback': traceback.format_exc()
-        }), 500
+            'success': True,
+            'markdown': result['markdown'],
+            'json': result['json'],
+            'metadata': result['metadata']
+        })
+        
+    except Exception as e:
+        return error_response('Error processing file', e)
 
 @app.route('/api/summarize_url', methods=['POST'])
-def summarize_url():
+async def summarize_url():
     """API endpoint to summarize paper from URL."""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data or 'url' not in data:
             return jsonify({'error': 'URL is required'}), 400
         
         url = data['url']
         metadata = data.get('metadata', {})
         
-        result = summarizer.summarize_paper(url, 'url', metadata)
+        result = await run_summarizer(url, 'url', metadata)
         
         return jsonify({
             'success': True,
@@ -105,23 +179,20 @@ def summarize_url():
         })
         
     except Exception as e:
-        return jsonify({
-            'error': f'Error processing URL: {str(e)}',
-            'traceback': traceback.format_exc()
-        }), 500
+        return error_response('Error processing URL', e)
 
 @app.route('/api/summarize_text', methods=['POST'])
-def summarize_text():
+async def summarize_text():
     """API endpoint to summarize raw text."""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data or 'text' not in data:
             return jsonify({'error': 'Text is required'}), 400
         
         text = data['text']
         metadata = data.get('metadata', {})
         
-        result = summarizer.summarize_paper(text, 'text', metadata)
+        result = await run_summarizer(text, 'text', metadata)
         
         return jsonify({
             'success': True,
@@ -131,26 +202,29 @@ def summarize_text():
         })
         
     except Exception as e:
-        return jsonify({
-            'error': f'Error processing text: {str(e)}',
-            'traceback': traceback.format_exc()
-        }), 500
+        return error_response('Error processing text', e)
 
 @app.route('/api/health')
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return jsonify({'status': 'healthy', 'service': 'PaperSummarizer'})
 
+@app.after_serving
+async def shutdown_executor():
+    """Stop the summarizer worker processes and flush queued log records."""
+    EXECUTOR.shutdown()
+    log_listener.stop()
+
 @app.errorhandler(413)
-def too_large(e):
+async def too_large(e):
     return jsonify({'error': 'File too large. Maximum size is 16MB.'}), 413
 
 @app.errorhandler(404)
-def not_found(e):
+async def not_found(e):
     return jsonify({'error': 'Endpoint not found'}), 404
 
 @app.errorhandler(500)
-def internal_error(e):
+async def internal_error(e):
     return jsonify({'error': 'Internal server error'}), 500
 
 if __name__ == '__main__':
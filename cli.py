@@ -4,10 +4,113 @@ Command Line Interface for PaperSummarizer
 """
 
 import argparse
-import json
+import orjson
 import sys
 import os
-from paper_summarizer import PaperSummarizer
+import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from summarizer_factory import get_summarizer
+
+# Stop prefetching PDFs once this many bytes have been requested, so a large
+# batch doesn't evict the files the workers are about to read
+PAGE_CACHE_WARM_BYTES = 1 << 30
+
+
+def _init_worker(cache):
+    """Build the summarizer, with its HTTP session and cache, once per worker process."""
+    get_summarizer(cache=cache)
+
+
+def _summarize_pdf(pdf_path, cache):
+    """Summarize one PDF inside a worker process."""
+    return get_summarizer(cache=cache).summarize_paper(pdf_path, 'pdf')
+
+
+def _warm_page_cache(paths):
+    """Ask the kernel to start reading the PDFs before the workers open them."""
+    if not hasattr(os, 'posix_fadvise'):
+        # Without readahead hints the worker processes still read in parallel
+        return
+    
+    budget = PAGE_CACHE_WARM_BYTES
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            budget -= os.fstat(fd).st_size
+            # Non-blocking: the kernel queues the reads and returns immediately
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+        if budget <= 0:
+            break
+
+
+def summarize_glob(args):
+    """Summarize every PDF matching --pdf-glob into --output-dir in parallel."""
+    pdf_paths = sorted(glob.glob(args.pdf_glob))
+    if not pdf_paths:
+        print(f"Error: No PDF files match: {args.pdf_glob}", file=sys.stderr)
+        return 1
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    if not args.quiet:
+        print(f"Processing {len(pdf_paths)} PDFs with {args.workers} workers...")
+    
+    _warm_page_cache(pdf_paths)
+    
+    # Text extraction and analysis are CPU-bound, so papers are spread over
+    # processes rather than threads
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(args.cache,)) as pool:
+        futures = {pool.submit(_summarize_pdf, path, args.cache): path for path in pdf_paths}
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                result = future.result()
+                stem = os.path.splitext(os.path.basename(pdf_path))[0]
+                markdown_path = os.path.join(args.output_dir, f"{stem}.md")
+                json_path = os.path.join(args.output_dir, f"{stem}.json")
+                with open(markdown_path, 'w', encoding='utf-8') as f:
+                    f.write(result['markdown'])
+                with open(json_path, 'wb') as f:
+                    f.write(orjson.dumps(result['json'], option=orjson.OPT_INDENT_2))
+            except Exception as e:
+                failures += 1
+                print(f"Error processing {pdf_path}: {e}", file=sys.stderr)
+                continue
+            if not args.quiet:
+                print(f"Summary saved to: {markdown_path}")
+    
+    if not args.quiet:
+        print(f"Done: {len(pdf_paths) - failures} of {len(pdf_paths)} PDFs summarized.")
+    return 1 if failures else 0
+
+
+def serve(summarizer):
+    """
+    Summarize a stream of jobs with one summarizer, so models load only once.
+    
+    Reads JSON Lines from stdin, each holding summarize_paper() arguments
+    (input_source, and optionally input_type and metadata), and writes one
+    JSON result per line to stdout, or {"error": ...} if a job fails.
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            job = orjson.loads(line)
+            output = summarizer.summarize_paper(**job)
+        except Exception as e:
+            output = {'error': str(e)}
+        sys.stdout.write(orjson.dumps(output).decode('utf-8') + '\n')
+        sys.stdout.flush()
+    return 0
 
 
 def main():
@@ -19,6 +122,8 @@ Examples:
   %(prog)s --pdf paper.pdf --output summary.md
   %(prog)s --url https://arxiv.org/abs/2301.00001 --json-output data.json
   %(prog)s --text "paper content..." --title "My Paper" --authors "John Doe"
+  %(prog)s --pdf-glob 'papers/*.pdf' --output-dir summaries --workers 8
+  %(prog)s --serve < jobs.jsonl > results.jsonl
         """
     )
     
@@ -28,6 +133,9 @@ Examples:
     input_group.add_argument('--url', type=str, help='URL to paper (ArXiv, etc.)')
     input_group.add_argument('--text', type=str, help='Raw paper text')
     input_group.add_argument('--text-file', type=str, help='Path to text file')
+    input_group.add_argument('--pdf-glob', type=str, help='Glob pattern of PDF files to summarize in parallel')
+    input_group.add_argument('--serve', action='store_true',
+                             help='Read JSON Lines jobs from stdin and write JSON results to stdout')
     
     # Metadata options
     parser.add_argument('--title', type=str, help='Paper title')
@@ -41,11 +149,27 @@ Examples:
     parser.add_argument('--print-markdown', action='store_true', help='Print Markdown to stdout')
     parser.add_argument('--print-json', action='store_true', help='Print JSON to stdout')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress progress messages')
+    parser.add_argument('--cache', action='store_true', help='Reuse cached results for previously seen papers')
+    
+    # Batch options
+    parser.add_argument('--output-dir', type=str, help='Output directory for --pdf-glob summaries')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes for --pdf-glob (default: CPU count)')
     
     args = parser.parse_args()
     
     # Validate arguments
-    if not any([args.output, args.json_output, args.print_markdown, args.print_json]):
+    if args.pdf_glob:
+        if not args.output_dir:
+            parser.error("--pdf-glob requires --output-dir")
+        if args.workers < 1:
+            parser.error("--workers must be at least 1")
+        return summarize_glob(args)
+    
+    if args.serve:
+        # Keep stdout clean for the JSON Lines results
+        args.quiet = True
+    elif not any([args.output, args.json_output, args.print_markdown, args.print_json]):
         parser.error("At least one output option must be specified")
     
     # Initialize summarizer
@@ -53,11 +177,14 @@ Examples:
         print("Initializing PaperSummarizer...")
     
     try:
-        summarizer = PaperSummarizer()
+        summarizer = get_summarizer(cache=args.cache)
     except Exception as e:
         print(f"Error initializing summarizer: {e}", file=sys.stderr)
         return 1
     
+    if args.serve:
+        return serve(summarizer)
+    
     # Prepare metadata
     metadata = {}
     if args.title:
@@ -130,8 +257,8 @@ Examples:
         
         # Save JSON output
         if args.json_output:
-            with open(args.json_output, 'w', encoding='utf-8') as f:
-                json.dump(result['json'], f, indent=2, ensure_ascii=False)
+            with open(args.json_output, 'wb') as f:
+                f.write(orjson.dumps(result['json'], option=orjson.OPT_INDENT_2))
             if not args.quiet:
                 print(f"JSON data saved to: {args.json_output}")
         
@@ -146,7 +273,7 @@ Examples:
             print("\n" + "="*80)
             print("JSON DATA")
             print("="*80)
-            print(json.dumps(result['json'], indent=2, ensure_ascii=False))
+            print(orjson.dumps(result['json'], option=orjson.OPT_INDENT_2).decode('utf-8'))
         
     except Exception as e:
         print(f"Error saving output: {e}", file=sys.stderr)
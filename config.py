@@ -3,6 +3,7 @@ Configuration settings for PaperSummarizer
 """
 
 import os
+from functools import cached_property
 
 class Config:
     """Base configuration class"""
@@ -12,7 +13,6 @@ class Config:
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     
     # Upload settings
-    UPLOAD_FOLDER = 'uploads'
     ALLOWED_EXTENSIONS = {'pdf', 'txt'}
     
     # Processing settings
@@ -33,6 +33,11 @@ class Config:
     # Model settings
     SPACY_MODEL = "en_core_web_sm"
     
+    # Cache settings
+    SUMMARY_CACHE_DIR = os.environ.get('SUMMARY_CACHE_DIR') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '.cache', 'summaries')
+    MODEL_VERSION = '1'  # Bump to invalidate cached summaries
+    
     # Validation rules
     STRICT_FAITHFULNESS = True
     PRESERVE_CITATIONS = True
@@ -49,7 +54,7 @@ class ProductionConfig(Config):
     DEBUG = False
     TESTING = False
     
-    @property
+    @cached_property
     def SECRET_KEY(self):
         secret_key = os.environ.get('SECRET_KEY')
         if not secret_key:
@@ -3,7 +3,7 @@ Example usage of PaperSummarizer
 """
 
 from paper_summarizer import PaperSummarizer
-import json
+import orjson
 
 def example_pdf_analysis():
     """Example: Analyze a PDF file"""
@@ -24,7 +24,7 @@ def example_pdf_analysis():
     print("Markdown Summary:")
     print(result['markdown'])
     print("\nJSON Data:")
-    print(json.dumps(result['json'], indent=2))
+    print(orjson.dumps(result['json'], option=orjson.OPT_INDENT_2).decode('utf-8'))
 
 def example_arxiv_analysis():
     """Example: Analyze paper from ArXiv URL"""
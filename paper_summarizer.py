@@ -1,18 +1,112 @@
 import re
-import json
+import orjson
 import requests
-from typing import Dict, List, Any, Optional, Tuple
-import PyPDF2
-from bs4 import BeautifulSoup
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-import spacy
-from transformers import pipeline
-import arxiv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Optional, Tuple, BinaryIO, Union
+try:
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
 import io
-import time
-import tempfile
 import os
+import mmap
+import tempfile
+from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import hashlib
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from itertools import chain
+import diskcache
+
+
+ARXIV_API_URL = 'https://export.arxiv.org/api/query'
+_ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom'}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Pre-compiled patterns used by the extractors
+# ArXiv ids (YYMM.NNNNN) from an abs/pdf path, or bare when not part of a longer number
+_ARXIV_ID_RE = re.compile(r'arxiv\.org/(?:abs|pdf)/([0-9]{4}\.[0-9]{4,5})|(?<![0-9.])([0-9]{4}\.[0-9]{4,5})')
+
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+# Elements kept when extracting text from HTML pages
+_HTML_TEXT_TAGS = ['title', 'article', 'main', 'section', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                   'p', 'li', 'pre', 'blockquote']
+# Markup removed when estimating how much visible text an HTML page has
+_HTML_MARKUP_RE = re.compile(rb'(?is)<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>')
+
+# ASCII control characters dropped by _clean_text (non-ASCII is dropped by encoding)
+_CONTROL_CHARS = dict.fromkeys(i for i in range(0x80) if not 0x20 <= i <= 0x7E and i != 0x0A)
+
+_SECTION_RES = {
+    'abstract': re.compile(r'(?i)abstract\s*\n(.*?)(?=\n\s*(?:introduction|1\.|keywords|index terms))', re.DOTALL),
+    'introduction': re.compile(r'(?i)(?:1\.\s*)?introduction\s*\n(.*?)(?=\n\s*(?:2\.|related work|background|method))', re.DOTALL),
+    'method': re.compile(r'(?i)(?:method|approach|algorithm|architecture)\s*\n(.*?)(?=\n\s*(?:\d+\.|experiment|evaluation|result))', re.DOTALL),
+    'results': re.compile(r'(?i)(?:result|experiment|evaluation)\s*\n(.*?)(?=\n\s*(?:\d+\.|discussion|conclusion|limitation))', re.DOTALL),
+    'conclusion': re.compile(r'(?i)conclusion\s*\n(.*?)(?=\n\s*(?:reference|acknowledgment|appendix))', re.DOTALL),
+    'limitations': re.compile(r'(?i)limitation\s*\n(.*?)(?=\n\s*(?:reference|acknowledgment|appendix))', re.DOTALL),
+}
+
+# Citation, equation and metric patterns carry their flags inline so they can
+# be compiled by RE2 when google-re2 is installed, and by re otherwise.
+
+# Citation markers in one pass; the bracket and parenthesis forms can't
+# overlap, so a single alternation finds the same markers as separate scans.
+_CITATION_RE = _scan_re.compile(
+    r'\[(?P<numeric>\d+(?:,\s*\d+)*)\]'                          # [1], [1,2,3]
+    r'|\((?P<author>[A-Za-z]+(?:\s+et\s+al\.?)?,?\s+\d{4})\)'    # (Smith et al., 2022), (Smith, 2022)
+)
+
+_EQUATION_RES = [
+    _scan_re.compile(r'(?s)\$\$(.*?)\$\$'),  # Display math
+    _scan_re.compile(r'(?s)\$(.*?)\$'),      # Inline math
+    _scan_re.compile(r'(?s)\\begin\{equation\}(.*?)\\end\{equation\}'),  # Equation environment
+    _scan_re.compile(r'(?s)\\begin\{align\}(.*?)\\end\{align\}'),         # Align environment
+]
+
+_METRIC_RES = [
+    _scan_re.compile(r'(?i)(accuracy|f1|bleu|rouge|perplexity|loss)\s*[:=]\s*([\d.]+)%?'),
+    _scan_re.compile(r'(?i)([\d.]+)%?\s*(accuracy|f1|bleu|rouge)'),
+    _scan_re.compile(r'(?i)achieves?\s+([\d.]+)%?\s+(accuracy|f1|bleu|rouge)'),
+    _scan_re.compile(r'(?i)(state-of-the-art|sota|best)\s+.*?([\d.]+)%?'),
+]
+
+_CONTRIBUTION_RES = [
+    re.compile(r'(?i)contributions?:?\s*\n(.*?)(?=\n\s*\d+\.|\n\s*[A-Z])', re.DOTALL),
+    re.compile(r'(?i)our contributions?.*?:?\s*(.*?)(?=\n\s*\d+\.|\n\s*[A-Z])', re.DOTALL),
+    re.compile(r'(?i)we (?:propose|present|introduce|contribute)\s+(.*?)(?=\.|\n)', re.DOTALL),
+]
+_LIST_ITEM_SPLIT = re.compile(r'[•\-\*]\s*|\d+\)\s*|\d+\.\s*')
+
+_DATASET_RES = [
+    re.compile(r'(?i)(imagenet|cifar|mnist|coco|squad|glue|superglue|wmt|opus)'),
+    re.compile(r'(?i)dataset[s]?\s*[:=]\s*([A-Za-z0-9\-_]+)'),
+    re.compile(r'(?i)we (?:use|evaluate on|test on)\s+([A-Za-z0-9\-_]+)\s+dataset'),
+]
+
+_BASELINE_RES = [
+    re.compile(r'(?i)baseline[s]?\s*[:=]\s*([A-Za-z0-9\-_\s]+)'),
+    re.compile(r'(?i)we compare (?:with|against|to)\s+([A-Za-z0-9\-_\s]+)'),
+    re.compile(r'(?i)compared to\s+([A-Za-z0-9\-_\s]+)'),
+]
+
+_LIMITATION_RES = [
+    re.compile(r'(?i)limitations?:?\s*\n(.*?)(?=\n\s*\d+\.|\n\s*[A-Z])', re.DOTALL),
+    re.compile(r'(?i)(?:however|but|limitation|drawback|weakness).*?([^.]+\.)', re.DOTALL),
+]
+
+_DEFINITION_RES = [
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+(?:a|an)\s+([^.]+\.)'),
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[:=]\s*([^.]+\.)'),
+]
 
 
 class PaperSummarizer:
@@ -20,32 +114,157 @@ class PaperSummarizer:
     Academically rigorous assistant for producing faithful research paper summaries.
     """
     
-    def __init__(self):
-        """Initialize the PaperSummarizer with required models and tools."""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    # Number of results kept in memory in front of the on-disk result cache
+    MEMORY_CACHE_SIZE = 256
+    
+    # How long fetched ArXiv papers are reused before checking for a new revision
+    ARXIV_CACHE_TTL = 7 * 24 * 60 * 60
+    
+    # Number of ArXiv metadata lookups remembered in memory
+    ARXIV_METADATA_CACHE_SIZE = 128
+    
+    # Contributions and definitions are only looked for in this many leading
+    # characters of the introduction, or of the paper if none was found
+    INTRO_SCAN_CHARS = 30_000
+    
+    # Fall back to parsing the whole HTML page when the content elements hold
+    # less than this fraction of its visible words
+    HTML_MIN_TEXT_RATIO = 0.5
+    
+    # Upper bound in seconds on the wait between HTTP retries
+    RETRY_BACKOFF_MAX = 5
+    
+    def __init__(self, cache_dir: Optional[str] = None, cache_version: str = '1',
+                 max_retries: int = 3, retry_delay: float = 0.5):
+        """
+        Initialize the PaperSummarizer with required models and tools.
         
-        # Download required NLTK data
+        Args:
+            cache_dir: Optional directory for caching results across runs,
+                keyed by a hash of the paper text and metadata, along with
+                text extracted from PDFs and fetched ArXiv papers
+            cache_version: Included in every cache key; bump it to invalidate
+                results produced by an older version of the pipeline
+            max_retries: How many times to retry a failed HTTP request
+            retry_delay: Base delay in seconds for the exponential backoff
+                between retries; the first retry is immediate
+        """
+        self.cache = diskcache.Cache(cache_dir) if cache_dir else None
+        self.cache_version = cache_version
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._arxiv_metadata = lru_cache(maxsize=self.ARXIV_METADATA_CACHE_SIZE)(self._fetch_arxiv_metadata)
+        
+        # Keep-alive HTTP session so repeated fetches reuse open connections;
+        # transient failures are retried with capped, jittered backoff by
+        # urllib3 so concurrent clients don't retry in lockstep
+        self.http = requests.Session()
+        self.http.headers.update({'User-Agent': USER_AGENT})
+        retries = Retry(total=max_retries, backoff_factor=retry_delay, backoff_jitter=retry_delay,
+                        backoff_max=self.RETRY_BACKOFF_MAX, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+    
+    @cached_property
+    def nlp(self):
+        """The spaCy English pipeline, loaded on first use; None if the model is missing."""
+        import spacy
         try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
+            return spacy.load("en_core_web_sm")
+        except OSError:
+            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm", file=sys.stderr)
+            return None
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
+        """Extract text content from a PDF file, reusing earlier extractions."""
+        if self.cache is None:
+            return self._extract_text_from_pdf_file(pdf_path)
+        
+        cache_key = self._pdf_cache_key(self._hash_file(pdf_path))
+        text = self.cache.get(cache_key)
+        if text is None:
+            text = self._extract_text_from_pdf_file(pdf_path)
+            self.cache.set(cache_key, text)
+        return text
+    
+    def _extract_text_from_pdf_file(self, pdf_path: str) -> str:
         """Extract text content from a PDF file."""
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+            # Prefer MuPDF's C parser; PyPDF2 is pure Python and much slower
+            text = self._try_mupdf(pdf_path)
+            if text is not None:
+                return text
+            
+            # Map the file so PyPDF2's many small reads are served from the page cache
+            with open(pdf_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._pdf_to_text(mapped)
+        except Exception as e:
+            raise ValueError(f"Error reading PDF: {str(e)}")
+    
+    def extract_text_from_pdf_stream(self, stream: BinaryIO) -> str:
+        """Extract text content from a binary file-like object holding a PDF."""
+        try:
+            pdf_bytes = stream.read()
+            
+            if self.cache is not None:
+                cache_key = self._pdf_cache_key(hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest())
+                text = self.cache.get(cache_key)
+                if text is None:
+                    text = self._pdf_bytes_to_text(pdf_bytes)
+                    self.cache.set(cache_key, text)
+                return text
+            
+            return self._pdf_bytes_to_text(pdf_bytes)
         except Exception as e:
             raise ValueError(f"Error reading PDF: {str(e)}")
     
+    def _pdf_bytes_to_text(self, pdf_bytes: bytes) -> str:
+        """Extract text content from PDF bytes."""
+        text = self._try_mupdf(pdf_bytes)
+        if text is not None:
+            return text
+        
+        return self._pdf_to_text(io.BytesIO(pdf_bytes))
+    
+    def _pdf_cache_key(self, digest: str) -> str:
+        """Build the cache key for text extracted from a PDF with the given digest."""
+        backend = 'mupdf' if pymupdf is not None else 'pypdf2'
+        return f"pdf-text:{backend}:{digest}"
+    
+    def _hash_file(self, path: str) -> str:
+        """Hash a file's contents without reading it into memory at once."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 16), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _try_mupdf(self, pdf: Union[str, bytes]) -> Optional[str]:
+        """Extract text with PyMuPDF, or return None if it is unavailable or fails."""
+        if pymupdf is None:
+            return None
+        try:
+            return self._extract_text_with_mupdf(pdf)
+        except Exception as mupdf_error:
+            print(f"MuPDF text extraction failed, falling back to PyPDF2: {mupdf_error}", file=sys.stderr)
+            return None
+    
+    def _pdf_to_text(self, stream: BinaryIO) -> str:
+        """Join the text of every page of a PDF stream, read with PyPDF2."""
+        import PyPDF2
+        pdf_reader = PyPDF2.PdfReader(stream)
+        return "\n".join(page.extract_text() or "" for page in pdf_reader.pages).strip()
+    
+    def _extract_text_with_mupdf(self, pdf: Union[str, bytes]) -> str:
+        """Extract text from a PDF path or PDF bytes using PyMuPDF."""
+        if isinstance(pdf, str):
+            doc = pymupdf.open(pdf, filetype='pdf')
+        else:
+            doc = pymupdf.open(stream=pdf, filetype='pdf')
+        with doc:
+            return "\n".join(page.get_text() for page in doc).strip()
+    
     def fetch_paper_from_url(self, url: str) -> Tuple[str, Dict[str, str]]:
         """Fetch paper content from URL (ArXiv, etc.)."""
         metadata = {}
@@ -58,160 +277,158 @@ class PaperSummarizer:
         
         # Handle general URLs
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            with self.http.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                
+                if response.headers.get('content-type', '').startswith('application/pdf'):
+                    # Handle PDF URLs
+                    pdf_path = self._spool_pdf(response)
+                else:
+                    pdf_path = None
+                    html = response.content
             
-            if response.headers.get('content-type', '').startswith('application/pdf'):
-                # Handle PDF URLs
-                pdf_reader = PyPDF2.PdfReader(io.BytesIO(response.content))
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip(), metadata
+            if pdf_path is not None:
+                try:
+                    return self.extract_text_from_pdf(pdf_path), metadata
+                finally:
+                    os.remove(pdf_path)
             else:
                 # Handle HTML pages
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract metadata
-                title_tag = soup.find('title')
-                if title_tag:
-                    metadata['title'] = title_tag.get_text().strip()
-                
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                
-                text = soup.get_text()
+                text, title = self._html_to_text(html)
+                if title:
+                    metadata['title'] = title
                 return self._clean_text(text), metadata
                 
         except Exception as e:
             raise ValueError(f"Error fetching URL: {str(e)}")
     
+    def _html_to_text(self, html: bytes) -> Tuple[str, Optional[str]]:
+        """Extract the readable text and the title of an HTML page."""
+        from bs4 import BeautifulSoup, SoupStrainer
+        
+        # Only build the tree for the title and content elements; get_text()
+        # already skips the strings of any <script> or <style> nested in them
+        soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer(_HTML_TEXT_TAGS))
+        # Straining drops the whitespace between blocks, so put it back
+        text = '\n'.join(element.get_text() for element in soup.contents)
+        
+        # Pages that keep much of their text in divs or tables would lose it,
+        # so compare against a tag-stripped word count and parse everything
+        visible_words = len(_HTML_MARKUP_RE.sub(b' ', html).split())
+        if len(text.split()) < self.HTML_MIN_TEXT_RATIO * visible_words:
+            soup = BeautifulSoup(html, 'lxml')
+            text = soup.get_text()
+        
+        title_tag = soup.find('title')
+        title = title_tag.get_text().strip() if title_tag else None
+        return text, title
+    
     def _extract_arxiv_id(self, url: str) -> Optional[str]:
         """Extract ArXiv ID from URL."""
-        patterns = [
-            r'arxiv\.org/abs/([0-9]+\.[0-9]+)',
-            r'arxiv\.org/pdf/([0-9]+\.[0-9]+)',
-            r'([0-9]+\.[0-9]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = _ARXIV_ID_RE.search(url)
+        return match and (match.group(1) or match.group(2))
     
     def _fetch_from_arxiv(self, arxiv_id: str) -> Tuple[str, Dict[str, str]]:
-        """Fetch paper from ArXiv API with retry logic."""
-        max_retries = 3
-        retry_delay = 1
-        
-        for attempt in range(max_retries):
+        """Fetch paper from ArXiv, falling back to the abstract if the PDF fails."""
+        cache_key = f"arxiv:{arxiv_id}"
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # The metadata lookup and the PDF download are independent, so look
+        # the metadata up once while the download runs. The HTTP session
+        # retries transient download failures.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            metadata_future = pool.submit(self._get_arxiv_metadata, arxiv_id)
+            
+            pdf_path = None
             try:
-                # Use arxiv library's built-in search
-                search = arxiv.Search(id_list=[arxiv_id])
-                paper = next(search.results())
-                
-                metadata = {
-                    'title': paper.title,
-                    'authors': ', '.join([author.name for author in paper.authors]),
-                    'venue_year': f"ArXiv {paper.published.year}",
-                    'doi_or_arxiv': f"arXiv:{arxiv_id}",
-                    'abstract': paper.summary
-                }
-                
-                # Try using arxiv library's download method first
-                try:
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        paper.download_pdf(dirpath=temp_dir, filename=f"{arxiv_id}.pdf")
-                        pdf_path = os.path.join(temp_dir, f"{arxiv_id}.pdf")
-                        
-                        # Extract text from downloaded PDF
-                        with open(pdf_path, 'rb') as file:
-                            pdf_reader = PyPDF2.PdfReader(file)
-                            text = ""
-                            for page in pdf_reader.pages:
-                                text += page.extract_text() + "\n"
-                        
-                        return text.strip(), metadata
-                        
-                except Exception as download_error:
-                    # Fallback to manual PDF download with retry
-                    print(f"ArXiv download failed, trying manual download (attempt {attempt + 1}): {download_error}")
-                    
-                    pdf_url = paper.pdf_url
-                    if pdf_url.startswith('http://'):
-                        pdf_url = pdf_url.replace('http://', 'https://')
-                    
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    
-                    response = requests.get(pdf_url, headers=headers, timeout=60)
-                    response.raise_for_status()
-                    pdf_reader = PyPDF2.PdfReader(io.BytesIO(response.content))
-                    
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                    
-                    return text.strip(), metadata
-                    
+                pdf_path = self._download_arxiv_pdf(arxiv_id)
+            except requests.RequestException as e:
+                print(f"ArXiv PDF download failed: {str(e)}", file=sys.stderr)
+            
+            try:
+                metadata = metadata_future.result()
             except Exception as e:
-                if attempt < max_retries - 1:
-                    print(f"ArXiv fetch attempt {attempt + 1} failed: {str(e)}")
-                    time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                    continue
-                else:
-                    # Try alternative approach - use abstract if PDF fails
-                    try:
-                        search = arxiv.Search(id_list=[arxiv_id])
-                        paper = next(search.results())
-                        
-                        metadata = {
-                            'title': paper.title,
-                            'authors': ', '.join([author.name for author in paper.authors]),
-                            'venue_year': f"ArXiv {paper.published.year}",
-                            'doi_or_arxiv': f"arXiv:{arxiv_id}",
-                            'abstract': paper.summary
-                        }
-                        
-                        # Return abstract as fallback text
-                        fallback_text = f"Title: {paper.title}\n\nAbstract: {paper.summary}\n\nNote: Full PDF text could not be retrieved due to connection issues."
-                        return fallback_text, metadata
-                        
-                    except Exception:
-                        raise ValueError(f"Error fetching ArXiv paper after {max_retries} attempts: {str(e)}")
-        
-        raise ValueError(f"Failed to fetch ArXiv paper after {max_retries} attempts")
+                if pdf_path is not None:
+                    os.remove(pdf_path)
+                raise ValueError(f"Error fetching ArXiv paper metadata: {str(e)}")
+        
+        if pdf_path is not None:
+            try:
+                text = self._extract_text_from_pdf_file(pdf_path)
+            except ValueError as e:
+                print(f"ArXiv PDF could not be parsed: {str(e)}", file=sys.stderr)
+            else:
+                # Only full papers are cached; the abstract fallback is retried next time
+                if self.cache is not None:
+                    self.cache.set(cache_key, (text, metadata), expire=self.ARXIV_CACHE_TTL)
+                return text, metadata
+            finally:
+                os.remove(pdf_path)
+        
+        # Fall back to the abstract if the PDF could not be retrieved
+        fallback_text = f"Title: {metadata['title']}\n\nAbstract: {metadata['abstract']}\n\nNote: Full PDF text could not be retrieved due to connection issues."
+        return fallback_text, metadata
+    
+    def _get_arxiv_metadata(self, arxiv_id: str) -> Dict[str, str]:
+        """Return ArXiv metadata, looking each id up at most once per process."""
+        # Copy so callers can add their own metadata without touching the cache
+        return dict(self._arxiv_metadata(arxiv_id))
+    
+    def _fetch_arxiv_metadata(self, arxiv_id: str) -> Dict[str, str]:
+        """Look up paper metadata through the ArXiv Atom API."""
+        response = self.http.get(ARXIV_API_URL, params={'id_list': arxiv_id}, timeout=30)
+        response.raise_for_status()
+        
+        entry = ElementTree.fromstring(response.content).find('atom:entry', _ATOM_NS)
+        # Unknown ids return an empty feed, malformed ones an error entry
+        if entry is None or '/api/errors' in entry.findtext('atom:id', '', _ATOM_NS):
+            raise ValueError(f"ArXiv paper not found: {arxiv_id}")
+        
+        authors = [author.findtext('atom:name', '', _ATOM_NS).strip()
+                   for author in entry.findall('atom:author', _ATOM_NS)]
+        return {
+            'title': ' '.join(entry.findtext('atom:title', '', _ATOM_NS).split()),
+            'authors': ', '.join(authors),
+            'venue_year': f"ArXiv {entry.findtext('atom:published', '', _ATOM_NS)[:4]}",
+            'doi_or_arxiv': f"arXiv:{arxiv_id}",
+            'abstract': entry.findtext('atom:summary', '', _ATOM_NS).strip()
+        }
+    
+    def _download_arxiv_pdf(self, arxiv_id: str) -> str:
+        """Download the PDF for an ArXiv paper to a temporary file and return its path."""
+        with self.http.get(f"https://arxiv.org/pdf/{arxiv_id}", stream=True, timeout=60) as response:
+            response.raise_for_status()
+            return self._spool_pdf(response)
+    
+    def _spool_pdf(self, response: requests.Response) -> str:
+        """Stream a PDF response body to a temporary file and return its path."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
+            try:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    tmp.write(chunk)
+            except BaseException:
+                tmp.close()
+                os.remove(tmp.name)
+                raise
+        return tmp.name
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove non-printable characters except newlines
-        text = re.sub(r'[^\x20-\x7E\n]', '', text)
+        # Remove excessive whitespace; str.split() uses the same whitespace set as \s
+        text = ' '.join(text.split())
+        # Remove non-printable characters
+        text = text.encode('ascii', 'ignore').decode('ascii').translate(_CONTROL_CHARS)
         return text.strip()
     
     def _extract_sections(self, text: str) -> Dict[str, str]:
         """Extract paper sections using pattern matching."""
         sections = {}
         
-        # Common section patterns
-        section_patterns = {
-            'abstract': r'(?i)abstract\s*\n(.*?)(?=\n\s*(?:introduction|1\.|keywords|index terms))',
-            'introduction': r'(?i)(?:1\.\s*)?introduction\s*\n(.*?)(?=\n\s*(?:2\.|related work|background|method))',
-            'method': r'(?i)(?:method|approach|algorithm|architecture)\s*\n(.*?)(?=\n\s*(?:\d+\.|experiment|evaluation|result))',
-            'results': r'(?i)(?:result|experiment|evaluation)\s*\n(.*?)(?=\n\s*(?:\d+\.|discussion|conclusion|limitation))',
-            'conclusion': r'(?i)conclusion\s*\n(.*?)(?=\n\s*(?:reference|acknowledgment|appendix))',
-            'limitations': r'(?i)limitation\s*\n(.*?)(?=\n\s*(?:reference|acknowledgment|appendix))'
-        }
-        
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, text, re.DOTALL)
+        for section_name, pattern in _SECTION_RES.items():
+            match = pattern.search(text)
             if match:
                 sections[section_name] = match.group(1).strip()
         
@@ -223,33 +440,13 @@ class PaperSummarizer:
     
     def _extract_citations(self, text: str) -> List[str]:
         """Extract citation markers from text."""
-        # Pattern for various citation formats
-        citation_patterns = [
-            r'\[(\d+(?:,\s*\d+)*)\]',  # [1], [1,2,3]
-            r'\(([A-Za-z]+(?:\s+et\s+al\.?)?,?\s+\d{4})\)',  # (Smith et al., 2022)
-            r'\(([A-Za-z]+,?\s+\d{4})\)'  # (Smith, 2022)
-        ]
-        
-        citations = set()
-        for pattern in citation_patterns:
-            matches = re.findall(pattern, text)
-            citations.update(matches)
-        
-        return sorted(list(citations))
+        return sorted({match.group(match.lastgroup) for match in _CITATION_RE.finditer(text)})
     
     def _extract_equations(self, text: str) -> List[str]:
         """Extract LaTeX equations from text."""
-        # Pattern for LaTeX equations
-        equation_patterns = [
-            r'\$\$(.*?)\$\$',  # Display math
-            r'\$(.*?)\$',      # Inline math
-            r'\\begin\{equation\}(.*?)\\end\{equation\}',  # Equation environment
-            r'\\begin\{align\}(.*?)\\end\{align\}'         # Align environment
-        ]
-        
         equations = []
-        for pattern in equation_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
+        for pattern in _EQUATION_RES:
+            matches = pattern.findall(text)
             equations.extend([eq.strip() for eq in matches if eq.strip()])
         
         return equations
@@ -258,16 +455,8 @@ class PaperSummarizer:
         """Extract numerical results and metrics from text."""
         results = []
         
-        # Pattern for common metrics (accuracy, F1, BLEU, etc.)
-        metric_patterns = [
-            r'(accuracy|f1|bleu|rouge|perplexity|loss)\s*[:=]\s*([\d.]+)%?',
-            r'([\d.]+)%?\s*(accuracy|f1|bleu|rouge)',
-            r'achieves?\s+([\d.]+)%?\s+(accuracy|f1|bleu|rouge)',
-            r'(state-of-the-art|sota|best)\s+.*?([\d.]+)%?'
-        ]
-        
-        for pattern in metric_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _METRIC_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 if len(match) == 2:
                     metric, value = match
@@ -281,14 +470,15 @@ class PaperSummarizer:
         
         return results
     
-    def summarize_paper(self, input_source: str, input_type: str = 'auto', 
+    def summarize_paper(self, input_source: Union[str, BinaryIO], input_type: str = 'auto', 
                        metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Main method to summarize a research paper.
         
         Args:
-            input_source: Path to PDF, URL, or raw text
-            input_type: 'pdf', 'url', 'text', or 'auto'
+            input_source: Path to PDF, URL, raw text, or a binary stream
+                for 'pdf_stream'
+            input_type: 'pdf', 'pdf_stream', 'url', 'text', or 'auto'
             metadata: Optional metadata dict
         
         Returns:
@@ -308,6 +498,9 @@ class PaperSummarizer:
         if input_type == 'pdf':
             text = self.extract_text_from_pdf(input_source)
             paper_metadata = metadata or {}
+        elif input_type == 'pdf_stream':
+            text = self.extract_text_from_pdf_stream(input_source)
+            paper_metadata = metadata or {}
         elif input_type == 'url':
             text, paper_metadata = self.fetch_paper_from_url(input_source)
             if metadata:
@@ -316,8 +509,45 @@ class PaperSummarizer:
             text = input_source
             paper_metadata = metadata or {}
         
-        # Process the paper
-        return self._process_paper_text(text, paper_metadata)
+        # Process the paper, reusing the result for previously seen input
+        if self.cache is None:
+            return self._process_paper_text(text, paper_metadata)
+        
+        cache_key = self._cache_key(text, paper_metadata)
+        result = self._get_cached_result(cache_key)
+        if result is None:
+            result = self._process_paper_text(text, paper_metadata)
+            self._set_cached_result(cache_key, result)
+        return result
+    
+    def _cache_key(self, text: str, metadata: Dict[str, str]) -> str:
+        """Build a content-addressed cache key for a paper."""
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=32)
+        digest.update(orjson.dumps(metadata, default=str, option=orjson.OPT_SORT_KEYS))
+        return f"{digest.hexdigest()}:{self.cache_version}"
+    
+    def _get_cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result, checking memory before disk."""
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
+            return self._memory_cache[key]
+        
+        result = self.cache.get(key)
+        if result is not None:
+            self._remember_result(key, result)
+        return result
+    
+    def _set_cached_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result in both the memory and disk caches."""
+        self.cache.set(key, result)
+        self._remember_result(key, result)
+    
+    def _remember_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Add a result to the in-memory LRU, evicting the oldest entry."""
+        self._memory_cache[key] = result
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
     
     def _process_paper_text(self, text: str, metadata: Dict[str, str]) -> Dict[str, Any]:
         """Process paper text and generate summary."""
@@ -369,11 +599,21 @@ class PaperSummarizer:
         
         # Use abstract or first part of text for TL;DR
         abstract_text = sections.get('abstract', text[:1000])
-        sentences = sent_tokenize(abstract_text)
+        sentences = self._split_sentences(abstract_text)
         tldr = ' '.join(sentences[:3]) if len(sentences) >= 3 else abstract_text[:300]
         
+        # Contributions are stated in the abstract and introduction, definitions in
+        # the introduction; without a detected introduction the opening of the
+        # paper (which includes the abstract) is scanned instead
+        introduction = sections.get('introduction')
+        intro_text = (introduction or text)[:self.INTRO_SCAN_CHARS]
+        if introduction:
+            contribution_text = sections.get('abstract', '') + '\n' + intro_text
+        else:
+            contribution_text = intro_text
+        
         # Extract contributions (look for numbered lists, bullet points)
-        contributions = self._extract_contributions(text)
+        contributions = self._extract_contributions(contribution_text)
         
         # Extract method summary
         method_text = sections.get('method', sections.get('full_text', text))
@@ -383,7 +623,7 @@ class PaperSummarizer:
         datasets = self._extract_datasets(text)
         baselines = self._extract_baselines(text)
         limitations = self._extract_limitations(text)
-        glossary = self._extract_glossary(text)
+        glossary = self._extract_glossary(intro_text)
         
         return {
             'tldr': tldr,
@@ -403,18 +643,11 @@ class PaperSummarizer:
         """Extract paper contributions."""
         contributions = []
         
-        # Look for contribution sections
-        contrib_patterns = [
-            r'(?i)contributions?:?\s*\n(.*?)(?=\n\s*\d+\.|\n\s*[A-Z])',
-            r'(?i)our contributions?.*?:?\s*(.*?)(?=\n\s*\d+\.|\n\s*[A-Z])',
-            r'(?i)we (?:propose|present|introduce|contribute)\s+(.*?)(?=\.|\n)'
-        ]
-        
-        for pattern in contrib_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
+        for pattern in _CONTRIBUTION_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 # Split by bullet points or numbers
-                items = re.split(r'[•\-\*]\s*|\d+\)\s*|\d+\.\s*', match)
+                items = _LIST_ITEM_SPLIT.split(match)
                 contributions.extend([item.strip() for item in items if item.strip()])
         
         return contributions[:5] if contributions else ['Not specified']
@@ -422,50 +655,28 @@ class PaperSummarizer:
     def _extract_method_summary(self, text: str) -> str:
         """Extract method summary."""
         # Look for method description
-        method_sentences = sent_tokenize(text[:2000])  # First 2000 chars
+        method_sentences = self._split_sentences(text[:2000])  # First 2000 chars
         return ' '.join(method_sentences[:3]) if method_sentences else 'Not specified'
     
+    def _split_sentences(self, text: str) -> List[str]:
+        """Split text into sentences at terminal punctuation followed by a capital."""
+        return [sentence for sentence in _SENT_SPLIT.split(text.strip()) if sentence]
+    
     def _extract_datasets(self, text: str) -> List[str]:
         """Extract dataset names."""
-        # Common dataset patterns
-        dataset_patterns = [
-            r'(?i)(imagenet|cifar|mnist|coco|squad|glue|superglue|wmt|opus)',
-            r'(?i)dataset[s]?\s*[:=]\s*([A-Za-z0-9\-_]+)',
-            r'(?i)we (?:use|evaluate on|test on)\s+([A-Za-z0-9\-_]+)\s+dataset'
-        ]
-        
-        datasets = set()
-        for pattern in dataset_patterns:
-            matches = re.findall(pattern, text)
-            datasets.update(matches)
-        
+        datasets = set(chain.from_iterable(pattern.findall(text) for pattern in _DATASET_RES))
         return list(datasets) if datasets else ['Not specified']
     
     def _extract_baselines(self, text: str) -> List[str]:
         """Extract baseline methods."""
-        baseline_patterns = [
-            r'(?i)baseline[s]?\s*[:=]\s*([A-Za-z0-9\-_\s]+)',
-            r'(?i)we compare (?:with|against|to)\s+([A-Za-z0-9\-_\s]+)',
-            r'(?i)compared to\s+([A-Za-z0-9\-_\s]+)'
-        ]
-        
-        baselines = set()
-        for pattern in baseline_patterns:
-            matches = re.findall(pattern, text)
-            baselines.update([b.strip() for b in matches])
-        
+        baselines = {b.strip() for b in chain.from_iterable(pattern.findall(text) for pattern in _BASELINE_RES)}
         return list(baselines) if baselines else ['Not specified']
     
     def _extract_limitations(self, text: str) -> List[str]:
         """Extract limitations."""
-        limitation_patterns = [
-            r'(?i)limitations?:?\s*\n(.*?)(?=\n\s*\d+\.|\n\s*[A-Z])',
-            r'(?i)(?:however|but|limitation|drawback|weakness).*?([^.]+\.)',
-        ]
-        
         limitations = []
-        for pattern in limitation_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
+        for pattern in _LIMITATION_RES:
+            matches = pattern.findall(text)
             limitations.extend([lim.strip() for lim in matches if lim.strip()])
         
         return limitations[:3] if limitations else ['Not specified']
@@ -473,14 +684,9 @@ class PaperSummarizer:
     def _extract_glossary(self, text: str) -> List[Dict[str, str]]:
         """Extract key terms and definitions."""
         # Simple glossary extraction - look for definitions
-        definition_patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+(?:a|an)\s+([^.]+\.)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[:=]\s*([^.]+\.)',
-        ]
-        
         glossary = []
-        for pattern in definition_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _DEFINITION_RES:
+            matches = pattern.findall(text)
             for term, definition in matches:
                 if len(glossary) < 10:  # Limit to 10 terms
                     glossary.append({
@@ -503,7 +709,7 @@ class PaperSummarizer:
         else:
             doi_link = doi_arxiv
         
-        markdown = f"""# 📄 Research Paper Summary: {json_data['title']}
+        parts = [f"""# 📄 Research Paper Summary: {json_data['title']}
 
 **Authors:** {metadata.get('authors', 'Not specified')}  
 **Venue/Year:** {metadata.get('venue_year', 'Not specified')}  
@@ -521,28 +727,28 @@ This research contributes to the field by addressing key challenges and proposin
 
 ---
 
-## 🔍 Core Contributions"""
+## 🔍 Core Contributions"""]
         
         for contrib in json_data['contributions']:
             if contrib != 'Not specified':
-                markdown += f"\n- {contrib}"
+                parts.append(f"\n- {contrib}")
         
         if not any(contrib != 'Not specified' for contrib in json_data['contributions']):
-            markdown += "\n- Core contributions not clearly specified in the paper"
+            parts.append("\n- Core contributions not clearly specified in the paper")
         
-        markdown += f"""
+        parts.append(f"""
 
 ---
 
 ## 🧪 Method
-{json_data['method']['summary']}"""
+{json_data['method']['summary']}""")
         
         if json_data['method']['equations']:
-            markdown += "\n\n**Key components:**"
+            parts.append("\n\n**Key components:**")
             for eq in json_data['method']['equations'][:3]:  # Limit to 3 equations
-                markdown += f"\n  - {eq}"
+                parts.append(f"\n  - {eq}")
         
-        markdown += f"""
+        parts.append(f"""
 
 ---
 
@@ -553,57 +759,57 @@ This research contributes to the field by addressing key challenges and proposin
 
 ---
 
-## 📈 Results"""
+## 📈 Results""")
         
         if json_data['results']:
-            markdown += "\n| Task | Score | Notes |\n|------|-------|-------|\n"
+            parts.append("\n| Task | Score | Notes |\n|------|-------|-------|\n")
             for result in json_data['results'][:5]:  # Limit to 5 results
-                markdown += f"| {result['metric'].title()} | {result['value']} | {result['dataset_or_benchmark']} |\n"
+                parts.append(f"| {result['metric'].title()} | {result['value']} | {result['dataset_or_benchmark']} |\n")
         else:
-            markdown += "\n- Specific numerical results not clearly extracted from the paper"
+            parts.append("\n- Specific numerical results not clearly extracted from the paper")
         
-        markdown += f"""
+        parts.append(f"""
 
 ---
 
-## ⚠️ Limitations & Risks"""
+## ⚠️ Limitations & Risks""")
         
         for limitation in json_data['limitations']:
             if limitation != 'Not specified':
-                markdown += f"\n- {limitation}"
+                parts.append(f"\n- {limitation}")
         
         if not any(lim != 'Not specified' for lim in json_data['limitations']):
-            markdown += "\n- Limitations not clearly specified in the paper"
+            parts.append("\n- Limitations not clearly specified in the paper")
         
-        markdown += f"""
+        parts.append(f"""
 
 ---
 
-## 🔁 Reproducibility"""
+## 🔁 Reproducibility""")
         
         if json_data['setup']['code_or_data_links']:
-            markdown += f"\n- **Code:** {', '.join(json_data['setup']['code_or_data_links'])}"
+            parts.append(f"\n- **Code:** {', '.join(json_data['setup']['code_or_data_links'])}")
         else:
-            markdown += "\n- **Code:** Not specified"
+            parts.append("\n- **Code:** Not specified")
         
         # Add model sizes if available in metadata
         if 'model_sizes' in metadata:
-            markdown += f"\n- **Model Sizes:** {metadata['model_sizes']}"
+            parts.append(f"\n- **Model Sizes:** {metadata['model_sizes']}")
         
-        markdown += f"""
+        parts.append(f"""
 
 ---
 
-## 📚 Glossary"""
+## 📚 Glossary""")
         
         for term_def in json_data['glossary'][:5]:  # Limit to 5 terms
             if term_def['term'] != 'Not specified':
-                markdown += f"\n- **{term_def['term']}:** {term_def['definition']}"
+                parts.append(f"\n- **{term_def['term']}:** {term_def['definition']}")
         
         if not any(term['term'] != 'Not specified' for term in json_data['glossary']):
-            markdown += "\n- Key terms not clearly extracted from the paper"
+            parts.append("\n- Key terms not clearly extracted from the paper")
         
-        markdown += f"""
+        parts.append(f"""
 
 ---
 
@@ -613,6 +819,6 @@ This research contributes to the field by addressing key challenges and proposin
 ---
 
 *Generated using automated paper summarization. Feel free to modify this summary as needed.*
-"""
+""")
         
-        return markdown
+        return "".join(parts)
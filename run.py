@@ -3,30 +3,68 @@ Production runner for PaperSummarizer
 """
 
 import os
+import sys
+from hypercorn.config import Config as HypercornConfig
+from hypercorn.run import run
 from app import app
 from config import config
 
+
+def create_app():
+    """Return the web application configured for the current environment."""
+    env = os.environ.get('FLASK_ENV', 'development')
+    # Load from an instance so property-based settings such as
+    # ProductionConfig.SECRET_KEY are evaluated, once, at startup
+    app.config.from_object(config.get(env, config['default'])())
+    return app
+
+
+def _event_loop_class():
+    """Use uvloop's faster event loop where it is installed."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return 'asyncio'
+    return 'uvloop'
+
+
 if __name__ == '__main__':
     # Get environment
     env = os.environ.get('FLASK_ENV', 'development')
     
     # Load configuration
-    app.config.from_object(config.get(env, config['default']))
+    create_app()
+    
+    cpu_count = os.cpu_count() or 1
+    debug = app.config['DEBUG']
+    
+    # One server process per CPU by default; each worker binds the port with
+    # SO_REUSEPORT so the kernel balances connections between them. Debug
+    # mode runs a single worker under the reloader instead.
+    if debug:
+        workers = 1
+    else:
+        workers = int(os.environ.get('WEB_WORKERS', cpu_count))
+    
+    # Split the CPUs between the workers' summarizer process pools
+    os.environ.setdefault('SUMMARIZER_PROCESSES', str(max(1, cpu_count // workers)))
     
-    # Create upload directory
-    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    server_config = HypercornConfig()
+    server_config.application_path = 'run:create_app()'
+    server_config.bind = ['0.0.0.0:5000']
+    server_config.workers = workers
+    server_config.worker_class = _event_loop_class()
+    server_config.backlog = 2048
+    server_config.use_reloader = debug
     
     print("=" * 60)
     print("🚀 PaperSummarizer - Academic Paper Analysis Tool")
     print("=" * 60)
     print(f"Environment: {env}")
-    print(f"Debug mode: {app.config['DEBUG']}")
+    print(f"Debug mode: {debug}")
+    print(f"Workers: {workers} ({server_config.worker_class})")
     print("Access the application at: http://localhost:5000")
     print("=" * 60)
     
     # Run the application
-    app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=app.config['DEBUG']
-    )
+    sys.exit(run(server_config))
@@ -0,0 +1,22 @@
+"""
+Shared, lazily constructed PaperSummarizer instance
+"""
+
+import functools
+
+from config import Config
+from paper_summarizer import PaperSummarizer
+
+
+@functools.lru_cache(maxsize=None)
+def get_summarizer(cache: bool = False) -> PaperSummarizer:
+    """
+    Return the process-wide summarizer, constructing it on first use.
+    
+    Args:
+        cache: Persist results in Config.SUMMARY_CACHE_DIR across runs
+    """
+    if not cache:
+        return PaperSummarizer()
+    return PaperSummarizer(cache_dir=Config.SUMMARY_CACHE_DIR,
+                           cache_version=Config.MODEL_VERSION)
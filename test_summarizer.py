@@ -2,7 +2,7 @@
 Test script for PaperSummarizer
 """
 
-import json
+import orjson
 from paper_summarizer import PaperSummarizer
 
 def test_text_summarization():
@@ -76,16 +76,22 @@ def test_text_summarization():
         print(f"Contributions: {len(result['json']['contributions'])}")
         print(f"Results found: {len(result['json']['results'])}")
         
+        # The abstract's "We present ..." sentence must be picked up as a contribution
+        assert 'a novel approach to natural language processing using transformer' in result['json']['contributions'], \
+            result['json']['contributions']
+        
         # Save test output
         with open('test_output.md', 'w', encoding='utf-8') as f:
             f.write(result['markdown'])
         
-        with open('test_output.json', 'w', encoding='utf-8') as f:
-            json.dump(result['json'], f, indent=2)
+        with open('test_output.json', 'wb') as f:
+            f.write(orjson.dumps(result['json'], option=orjson.OPT_INDENT_2))
         
         print("✅ Test outputs saved to test_output.md and test_output.json")
         return True
         
+    except AssertionError:
+        raise
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return False